@@ -32,4 +32,5 @@ if __name__ == "__main__":
         port=port,
         reload=True,
         log_level="info",
+        ws_per_message_deflate=False,  # Small JSON frames, not worth compressing
     )
@@ -592,6 +592,8 @@ class RoboticsCore:
             return
 
         message_text = json.dumps(message)
+        # Copy, not a lazy chain: sends below await, and a concurrent leave_room
+        # mutates room.consumers
         participants = []
 
         # Add producer if exists
@@ -1,15 +1,18 @@
 import asyncio
-import json
 import logging
+import os
+import re
 import time
 import uuid
 from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from fractions import Fraction
 from functools import lru_cache
 
 import av
 import cv2
+import msgspec
 import numpy as np
 from aiortc import (
     RTCConfiguration,
@@ -19,18 +22,22 @@ from aiortc import (
     RTCSessionDescription,
     VideoStreamTrack,
 )
+from aiortc.sdp import SessionDescription
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic import ValidationError
 
 from .models import (
     EmergencyStopMessageDict,
     ErrorMessageDict,
-    HeartbeatAckMessageDict,
     JoinedMessageDict,
     MessageType,
+    ParticipantInfoDict,
     ParticipantJoinedMessageDict,
     ParticipantRole,
-    RawWebRTCMessageType,
-    RawWebRTCSignalingMessage,
+    RawWebRTCAnswer,
+    RawWebRTCIce,
+    RawWebRTCOffer,
+    RawWebRTCSignal,
     RecoveryConfig,
     RecoveryPolicy,
     RecoveryTriggeredMessageDict,
@@ -42,20 +49,32 @@ from .models import (
     # Core data structures
     VideoConfigUpdateMessageDict,
     WebRTCAnswerMessageDict,
-    WebRTCIceMessageDict,
     WebRTCOfferMessageDict,
     WebSocketMessageDict,
+    encode_heartbeat_ack,
+    resolution_to_dict,
 )
 
 logger = logging.getLogger(__name__)
 
+# Make sure OpenCV dispatches to its SIMD/IPP kernels, leaving cores for the loop
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
+# "candidate:<foundation> <component> <protocol> <priority> <ip> <port> typ <type>"
+ICE_CANDIDATE_RE = re.compile(
+    r"candidate:(\S+)\s+(\d+)\s+(\S+)\s+(\d+)\s+(\S+)\s+(\d+)\s+typ\s+(\S+)"
+)
+
 # ============= FRAME CACHE =============
 
 
 @lru_cache(maxsize=8)  # Cache up to 8 different resolutions
 def get_black_frame(width: int, height: int) -> np.ndarray:
     """Get cached black frame for given dimensions"""
-    return np.zeros((height, width, 3), dtype=np.uint8)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame.flags.writeable = False  # Shared cache entry, wrapped without copying
+    return frame
 
 
 @lru_cache(maxsize=4)  # Cache up to 4 different info frame variants
@@ -96,9 +115,51 @@ def get_connection_info_frame(
         1,
     )
 
+    frame.flags.writeable = False  # Shared cache entry, wrapped without copying
     return frame
 
 
+@lru_cache(maxsize=4)  # Cache up to 4 different overlay variants
+def get_status_overlay_frame(
+    width: int,
+    height: int,
+    bg_color: tuple[int, int, int],
+    text_color: tuple[int, int, int],
+) -> np.ndarray:
+    """Get cached status overlay blended on top of held frames"""
+    overlay = np.full((height, width, 3), bg_color, dtype=np.uint8)
+
+    # Add text to overlay
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    font_scale = min(width / 640, height / 480) * 0.8
+    text = "RECONNECTING"
+    text_size = cv2.getTextSize(text, font, font_scale, 2)[0]
+    text_x = (width - text_size[0]) // 2
+    text_y = height // 2
+    cv2.putText(overlay, text, (text_x, text_y), font, font_scale, text_color, 2)
+
+    overlay.flags.writeable = False
+    return overlay
+
+
+def warm_frame_caches(width: int, height: int, config: RecoveryConfig) -> None:
+    """Pre-render one resolution's recovery frames so a first reconnect never blocks recv"""
+    get_black_frame(width, height)
+    get_connection_info_frame(
+        width, height, config.info_frame_bg_color, config.info_frame_text_color
+    )
+    get_status_overlay_frame(
+        width, height, config.info_frame_bg_color, config.info_frame_text_color
+    )
+
+
+def get_frame_buffer(buffer: np.ndarray | None, shape: tuple) -> np.ndarray:
+    """Return buffer if it matches shape, otherwise allocate a new one"""
+    if buffer is None or buffer.shape != shape:
+        return np.empty(shape, dtype=np.uint8)
+    return buffer
+
+
 def add_frame_hold_indicator(frame: np.ndarray, reuse_count: int) -> np.ndarray:
     """Add a subtle indicator that this frame is being held"""
     height, width = frame.shape[:2]
@@ -120,20 +181,101 @@ def add_frame_hold_indicator(frame: np.ndarray, reuse_count: int) -> np.ndarray:
     x_end = x_start + indicator_size
 
     if y_end < height and x_end < width:
-        frame[y_start:y_end, x_start:x_end] = color
+        # Filled rectangle (inclusive corners) runs in OpenCV without the GIL
+        cv2.rectangle(frame, (x_start, y_start), (x_end - 1, y_end - 1), color, -1)
 
     return frame
 
 
+# ============= JPEG ENCODING =============
+
+# Frames are requested from PyAV in OpenCV's native BGR layout, so encoding
+# needs no separate cvtColor pass
+JPEG_PIXEL_FORMAT = "bgr24"
+
+
+def encode_frame_to_jpeg(img: np.ndarray, quality: int = 80) -> bytes | None:
+    """Encode a BGR frame as JPEG (runs in a worker thread)"""
+    success, jpeg_data = cv2.imencode(".jpg", img, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    return jpeg_data.tobytes() if success else None
+
+
+# ============= JSON SERIALIZATION =============
+
+# One reusable msgspec Encoder, which handles StrEnum members natively. Frames
+# stay text so browser clients can keep JSON.parse-ing event.data
+_json_encoder = msgspec.json.Encoder()
+# Reused scratch buffer for encode_into; only touched from the event loop, and
+# every caller copies it out as an immutable str before the next encode
+_json_buffer = bytearray(4096)
+
+
+def _dumps(message: dict | str) -> str:
+    """Serialize a message as a JSON text frame"""
+    _json_encoder.encode_into(message, _json_buffer)
+    return _json_buffer.decode()
+
+
+# Accepts str or bytes frames without a separate decode pass
+_loads = msgspec.json.decode
+_JSONDecodeError = msgspec.DecodeError
+
+# WebRTCIceMessageDict envelopes for the ICE relay: only the candidate, sender id
+# (both JSON-encoded) and timestamp vary, so the rest is spliced in as-is
+_ICE_FROM_PRODUCER_TEMPLATE = (
+    f'{{"type":"{MessageType.WEBRTC_ICE}","candidate":%s,'
+    '"from_producer":%s,"from_consumer":null,"timestamp":"%s"}'
+)
+_ICE_FROM_CONSUMER_TEMPLATE = (
+    f'{{"type":"{MessageType.WEBRTC_ICE}","candidate":%s,'
+    '"from_producer":null,"from_consumer":%s,"timestamp":"%s"}'
+)
+
+# Plain str (not StrEnum) for the per-message heartbeat check on parsed JSON
+HEARTBEAT_TYPE = MessageType.HEARTBEAT.value
+
+
+# ============= SHARED FRAME SLOT =============
+
+
+class LatestFrameSlot:
+    """Latest encoded frame, shared by every reader of a room"""
+
+    def __init__(self):
+        self.data: bytes | None = None
+        self.seq = 0
+        self._event = asyncio.Event()
+
+    def publish(self, frame_data: bytes) -> None:
+        """Replace the latest frame and wake all waiting readers (O(1))"""
+        self.data = frame_data
+        self.seq += 1
+        # Swap in a fresh event so readers never need to clear a shared one
+        event, self._event = self._event, asyncio.Event()
+        event.set()
+
+    async def wait_newer(self, seen_seq: int) -> None:
+        """Wait until a frame newer than seen_seq has been published"""
+        if self.seq == seen_seq:
+            await self._event.wait()
+
+
 # ============= VIDEO FRAME TRACK =============
 
 
 class VideoFrameTrack(VideoStreamTrack):
     """Video track for WebRTC streaming with recovery support"""
 
-    def __init__(self, recovery_config: RecoveryConfig | None = None):
+    def __init__(
+        self,
+        recovery_config: RecoveryConfig | None = None,
+        frame_slot: LatestFrameSlot | None = None,
+    ):
         super().__init__()
-        self.frame_queue = asyncio.Queue(maxsize=2)  # Small buffer for low latency
+        # Latest-frame slot (the room's, when shared): consumers slower than the
+        # producer skip straight to the newest frame
+        self.frame_slot = frame_slot or LatestFrameSlot()
+        self.seen_seq = self.frame_slot.seq
         self.pts = 0
         self.time_base = 1 / 30  # 30 FPS
 
@@ -144,6 +286,11 @@ class VideoFrameTrack(VideoStreamTrack):
         self.frame_reuse_count = 0
         self.last_frame_dimensions = (480, 640)  # Default fallback dimensions
 
+        # Reusable output buffers for recovery effects
+        self._recovery_scratch: np.ndarray | None = None
+        self._fade_buf: np.ndarray | None = None
+        self._overlay_buf: np.ndarray | None = None
+
         logger.info(
             f"VideoFrameTrack created with recovery policy: {self.config.recovery_policy.value}"
         )
@@ -154,7 +301,11 @@ class VideoFrameTrack(VideoStreamTrack):
 
         try:
             # Try to get a fresh frame with timeout
-            frame_data = await asyncio.wait_for(self.frame_queue.get(), timeout=0.1)
+            await asyncio.wait_for(
+                self.frame_slot.wait_newer(self.seen_seq), timeout=0.1
+            )
+            frame_data = self.frame_slot.data
+            self.seen_seq = self.frame_slot.seq
 
             if frame_data:
                 # Decode JPEG to numpy array
@@ -165,8 +316,9 @@ class VideoFrameTrack(VideoStreamTrack):
                     # Convert BGR to RGB for WebRTC
                     img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
-                    # Store as last good frame for recovery
-                    self.last_good_frame = img_rgb.copy()
+                    # Store as last good frame for recovery (never mutated again)
+                    img_rgb.flags.writeable = False
+                    self.last_good_frame = img_rgb
                     self.last_good_frame_time = current_time
                     self.last_frame_dimensions = (
                         img_rgb.shape[0],
@@ -174,8 +326,9 @@ class VideoFrameTrack(VideoStreamTrack):
                     )
                     self.frame_reuse_count = 0
 
-                    # Create video frame
-                    frame = av.VideoFrame.from_ndarray(img_rgb, format="rgb24")
+                    # Wrap the fresh, read-only array without copying it into a
+                    # new AVFrame buffer (encoders only read it to reformat)
+                    frame = av.VideoFrame.from_numpy_buffer(img_rgb, format="rgb24")
                 else:
                     # JPEG decode failed - use recovery
                     frame = self._create_recovery_frame(current_time)
@@ -217,7 +370,11 @@ class VideoFrameTrack(VideoStreamTrack):
 
         # Generate frame based on policy
         recovery_frame = self._apply_recovery_policy(policy)
-        frame = av.VideoFrame.from_ndarray(recovery_frame, format="rgb24")
+        if recovery_frame.flags.writeable:
+            frame = av.VideoFrame.from_ndarray(recovery_frame, format="rgb24")
+        else:
+            # Immutable source (cached or held frame) - wrap without copying
+            frame = av.VideoFrame.from_numpy_buffer(recovery_frame, format="rgb24")
         frame.pts = self.pts
         frame.time_base = Fraction(1, 30)
         return frame
@@ -228,10 +385,15 @@ class VideoFrameTrack(VideoStreamTrack):
 
         if policy == RecoveryPolicy.FREEZE_LAST_FRAME:
             if self.last_good_frame is not None:
-                frame = self.last_good_frame.copy()
                 if self.config.show_hold_indicators:
-                    frame = add_frame_hold_indicator(frame, self.frame_reuse_count)
-                return frame
+                    self._recovery_scratch = get_frame_buffer(
+                        self._recovery_scratch, self.last_good_frame.shape
+                    )
+                    cv2.copyTo(self.last_good_frame, None, self._recovery_scratch)
+                    return add_frame_hold_indicator(
+                        self._recovery_scratch, self.frame_reuse_count
+                    )
+                return self.last_good_frame
             return get_black_frame(width, height)
 
         if policy == RecoveryPolicy.CONNECTION_INFO:
@@ -247,7 +409,6 @@ class VideoFrameTrack(VideoStreamTrack):
 
         if policy == RecoveryPolicy.FADE_TO_BLACK:
             if self.last_good_frame is not None:
-                frame = self.last_good_frame.copy()
                 # Apply fade effect
                 fade_factor = max(
                     0.0,
@@ -258,40 +419,41 @@ class VideoFrameTrack(VideoStreamTrack):
                         / self.config.max_frame_reuse_count
                     ),
                 )
-                frame = (frame * fade_factor).astype(np.uint8)
-                return frame
+                # Single uint8 pass into a reused buffer (no float64 temporary)
+                self._fade_buf = get_frame_buffer(
+                    self._fade_buf, self.last_good_frame.shape
+                )
+                return cv2.convertScaleAbs(
+                    self.last_good_frame,
+                    dst=self._fade_buf,
+                    alpha=fade_factor,
+                    beta=0,
+                )
             return get_black_frame(width, height)
 
         if policy == RecoveryPolicy.OVERLAY_STATUS:
             if self.last_good_frame is not None:
-                frame = self.last_good_frame.copy()
-
-                # Create overlay
-                overlay = np.full_like(
-                    frame, self.config.info_frame_bg_color, dtype=np.uint8
-                )
-
-                # Add text to overlay
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                font_scale = min(width / 640, height / 480) * 0.8
-                text = "RECONNECTING"
-                text_size = cv2.getTextSize(text, font, font_scale, 2)[0]
-                text_x = (width - text_size[0]) // 2
-                text_y = height // 2
-                cv2.putText(
-                    overlay,
-                    text,
-                    (text_x, text_y),
-                    font,
-                    font_scale,
+                frame_height, frame_width = self.last_good_frame.shape[:2]
+                overlay = get_status_overlay_frame(
+                    frame_width,
+                    frame_height,
+                    self.config.info_frame_bg_color,
                     self.config.info_frame_text_color,
-                    2,
                 )
 
                 # Blend overlay with original frame
                 alpha = self.config.overlay_opacity
-                frame = cv2.addWeighted(frame, 1 - alpha, overlay, alpha, 0)
-                return frame
+                self._overlay_buf = get_frame_buffer(
+                    self._overlay_buf, self.last_good_frame.shape
+                )
+                return cv2.addWeighted(
+                    self.last_good_frame,
+                    1 - alpha,
+                    overlay,
+                    alpha,
+                    0,
+                    dst=self._overlay_buf,
+                )
             return get_black_frame(width, height)
 
         # Unknown policy, fallback to black
@@ -299,17 +461,8 @@ class VideoFrameTrack(VideoStreamTrack):
         return get_black_frame(width, height)
 
     def add_frame(self, frame_data: bytes) -> None:
-        """Add frame to queue (non-blocking)"""
-        try:
-            self.frame_queue.put_nowait(frame_data)
-        except asyncio.QueueFull:
-            # Drop oldest frame for low latency
-            try:
-                self.frame_queue.get_nowait()
-                self.frame_queue.put_nowait(frame_data)
-                logger.debug("Dropped old frame to maintain low latency")
-            except asyncio.QueueEmpty:
-                pass
+        """Publish the latest frame (non-blocking, replaces any unsent frame)"""
+        self.frame_slot.publish(frame_data)
 
 
 # ============= WEBRTC CONNECTION  =============
@@ -324,9 +477,11 @@ class WebRTCConnection:
         room_id: str,
         on_frame_callback: Callable,
         video_core: "VideoCore",
+        workspace_id: str | None = None,
     ):
         self.client_id = client_id
         self.room_id = room_id
+        self.workspace_id = workspace_id
         self.on_frame = on_frame_callback
         self.video_core = video_core  # Reference to core for broadcasting
         self.pc = None  # RTCPeerConnection
@@ -334,6 +489,9 @@ class WebRTCConnection:
         self.is_producer = False
         self.is_consumer = False
         self.background_tasks: set[asyncio.Task] = set()
+        # Keep JPEG encoding off the event loop (created once producer video arrives)
+        self._encode_executor: ThreadPoolExecutor | None = None
+        self._ice_complete = asyncio.Event()
 
     async def initialize(self):
         """Initialize peer connection"""
@@ -349,6 +507,7 @@ class WebRTCConnection:
         self.pc.on("track", self._on_track)
         self.pc.on("connectionstatechange", self._on_connection_state)
         self.pc.on("iceconnectionstatechange", self._on_ice_state)
+        self.pc.on("icegatheringstatechange", self._on_ice_gathering_state)
 
         logger.info(f"WebRTC connection {self.client_id} initialized")
 
@@ -360,6 +519,10 @@ class WebRTCConnection:
     def _on_ice_state(self) -> None:
         logger.info(f"WebRTC {self.client_id} ICE state: {self.pc.iceConnectionState}")
 
+    def _on_ice_gathering_state(self) -> None:
+        if self.pc.iceGatheringState == "complete":
+            self._ice_complete.set()
+
     def _on_track(self, track: av.VideoStream) -> None:
         """Handle incoming video track from producer"""
         logger.info(f"WebRTC {self.client_id} received track: {track.kind}")
@@ -374,34 +537,35 @@ class WebRTCConnection:
     async def _process_incoming_video(self, track):
         """Process video frames from producer"""
         frame_count = 0
+        # Frames are encoded one at a time, so a single worker is enough
+        if self._encode_executor is None:
+            self._encode_executor = ThreadPoolExecutor(max_workers=1)
 
         try:
             while True:
                 frame = await track.recv()
                 frame_count += 1
 
-                # Convert to OpenCV format
-                img = frame.to_ndarray(format="rgb24")
-                img_bgr = cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
-
-                # Encode as JPEG
-                success, jpeg_data = cv2.imencode(
-                    ".jpg", img_bgr, [cv2.IMWRITE_JPEG_QUALITY, 80]
+                # Encode as JPEG in a worker thread
+                img = frame.to_ndarray(format=JPEG_PIXEL_FORMAT)
+                jpeg_data = await asyncio.get_running_loop().run_in_executor(
+                    self._encode_executor, encode_frame_to_jpeg, img
                 )
 
-                if success:
+                if jpeg_data:
                     # Send to processing pipeline
-                    await self.on_frame(self.client_id, jpeg_data.tobytes())
+                    await self.on_frame(self.client_id, jpeg_data)
 
                     # Broadcast frames to consumers
                     if self.video_core:
                         await self.video_core.broadcast_to_consumers(
-                            self.room_id, jpeg_data.tobytes()
+                            self.workspace_id, self.room_id, jpeg_data
                         )
 
-                    if frame_count % 30 == 0:  # Log every second
+                    # Log every ~10 seconds, only when INFO is enabled
+                    if frame_count % 300 == 0 and logger.isEnabledFor(logging.INFO):
                         logger.info(
-                            f"WebRTC {self.client_id} processed {frame_count} frames"
+                            "WebRTC %s processed %d frames", self.client_id, frame_count
                         )
 
         except Exception:
@@ -425,53 +589,49 @@ class WebRTCConnection:
             elif participant_role == "consumer":
                 self.is_consumer = True
                 self.is_producer = False
-                room = self.video_core.rooms.get(self.room_id)
-                recovery_config = room.recovery_config if room else RecoveryConfig()
-                self.video_track = VideoFrameTrack(recovery_config)
+                self.video_track = self._create_consumer_track()
                 self.pc.addTrack(self.video_track)
                 logger.info(
                     f"WebRTC {self.client_id} set as CONSUMER (explicit role) - video track added"
                 )
             else:
-                # Auto-detection logic (fallback)
-                has_recvonly = "a=recvonly" in sdp
-                has_sendonly = "a=sendonly" in sdp
-                has_video = "m=video" in sdp
+                # Auto-detection logic (fallback) from the parsed offer
+                media = SessionDescription.parse(sdp).media
+                directions = {m.direction for m in media}
+                has_recvonly = "recvonly" in directions
+                has_sendonly = "sendonly" in directions
+                has_video = any(m.kind == "video" for m in media)
 
                 # Check if there are video track sources in the offer (indicates producer)
-                has_video_sources = "a=ssrc:" in sdp and "m=video" in sdp
-
-                logger.info(f"🔍 Role detection for {self.client_id}:")
-                logger.info(f"   - has_recvonly: {has_recvonly}")
-                logger.info(f"   - has_sendonly: {has_sendonly}")
-                logger.info(f"   - has_video: {has_video}")
-                logger.info(f"   - has_video_sources: {has_video_sources}")
+                has_video_sources = any(m.kind == "video" and m.ssrc for m in media)
 
                 if has_recvonly:
                     is_consumer_request = True
-                    logger.info("   - CONSUMER detected: has a=recvonly")
+                    detection = "CONSUMER detected: has a=recvonly"
                 elif has_sendonly or has_video_sources:
                     is_consumer_request = False
-                    logger.info(
-                        "   - PRODUCER detected: has a=sendonly or video sources"
-                    )
+                    detection = "PRODUCER detected: has a=sendonly or video sources"
                 elif has_video:
                     # Default: if it has video but no clear direction, assume consumer
                     is_consumer_request = True
-                    logger.info(
-                        "   - CONSUMER detected: has video but no clear direction"
-                    )
+                    detection = "CONSUMER detected: has video but no clear direction"
                 else:
                     # No video at all, treat as consumer
                     is_consumer_request = True
-                    logger.info("   - CONSUMER detected: no video")
+                    detection = "CONSUMER detected: no video"
+
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"🔍 Role detection for {self.client_id}:")
+                    logger.info(f"   - has_recvonly: {has_recvonly}")
+                    logger.info(f"   - has_sendonly: {has_sendonly}")
+                    logger.info(f"   - has_video: {has_video}")
+                    logger.info(f"   - has_video_sources: {has_video_sources}")
+                    logger.info(f"   - {detection}")
 
                 if is_consumer_request:
                     # This is a consumer - add video track for sending TO the consumer
                     self.is_consumer = True
-                    room = self.video_core.rooms.get(self.room_id)
-                    recovery_config = room.recovery_config if room else RecoveryConfig()
-                    self.video_track = VideoFrameTrack(recovery_config)
+                    self.video_track = self._create_consumer_track()
                     self.pc.addTrack(self.video_track)
                     logger.info(
                         f"WebRTC {self.client_id} is now a CONSUMER - video track added"
@@ -487,13 +647,11 @@ class WebRTCConnection:
             await self.pc.setLocalDescription(answer)
 
             # Wait for ICE gathering with timeout
-            timeout_count = 0
-            while self.pc.iceGatheringState != "complete" and timeout_count < 50:
-                await asyncio.sleep(0.1)
-                timeout_count += 1
-
-            if timeout_count >= 50:
-                logger.warning(f"ICE gathering timeout for {self.client_id}")
+            if self.pc.iceGatheringState != "complete":
+                try:
+                    await asyncio.wait_for(self._ice_complete.wait(), timeout=5.0)
+                except TimeoutError:
+                    logger.warning(f"ICE gathering timeout for {self.client_id}")
 
         except Exception:
             logger.exception(f"Error in handle_offer for {self.client_id}")
@@ -516,43 +674,42 @@ class WebRTCConnection:
                 return
 
             # Parse the candidate string
-            parts = candidate_str.split()
-            if len(parts) < 8 or not parts[0].startswith("candidate:"):
+            match = ICE_CANDIDATE_RE.match(candidate_str)
+            if match is None:
                 logger.warning(
                     f"Invalid candidate format for {self.client_id}: {candidate_str}"
                 )
                 return
 
-            try:
-                foundation = parts[0].split(":")[1]
-                component = int(parts[1])
-                protocol = parts[2].lower()
-                priority = int(parts[3])
-                ip = parts[4]
-                port = int(parts[5])
-                typ = parts[7] if parts[6] == "typ" else "host"
-
-                candidate = RTCIceCandidate(
-                    foundation=foundation,
-                    component=component,
-                    protocol=protocol,
-                    priority=priority,
-                    ip=ip,
-                    port=port,
-                    type=typ,
-                    sdpMid=sdp_mid,
-                    sdpMLineIndex=sdp_m_line_index,
-                )
-
-                await self.pc.addIceCandidate(candidate)
-                logger.debug(f"ICE candidate added for {self.client_id}: {typ}")
+            foundation, component, protocol, priority, ip, port, typ = match.groups()
+            candidate = RTCIceCandidate(
+                foundation=foundation,
+                component=int(component),
+                protocol=protocol.lower(),
+                priority=int(priority),
+                ip=ip,
+                port=int(port),
+                type=typ,
+                sdpMid=sdp_mid,
+                sdpMLineIndex=sdp_m_line_index,
+            )
 
-            except (ValueError, IndexError):
-                logger.exception(f"Failed to parse ICE candidate for {self.client_id}")
+            await self.pc.addIceCandidate(candidate)
+            logger.debug(f"ICE candidate added for {self.client_id}: {candidate.type}")
 
         except Exception:
             logger.exception(f"Failed to add ICE candidate for {self.client_id}")
 
+    def _create_consumer_track(self) -> VideoFrameTrack:
+        """Create an outgoing track reading the room's shared latest frame"""
+        room = self.video_core._get_room(self.workspace_id, self.room_id)
+        if not room:
+            return VideoFrameTrack(RecoveryConfig())
+        if room.config.resolution:
+            width, height = room.config.resolution
+            warm_frame_caches(width, height, room.recovery_config)
+        return VideoFrameTrack(room.recovery_config, room.latest_frame)
+
     def send_video_frame(self, frame_data: bytes):
         """Send video frame to consumer"""
         if self.is_consumer and self.video_track:
@@ -562,6 +719,8 @@ class WebRTCConnection:
         """Close connection"""
         if self.pc:
             await self.pc.close()
+        if self._encode_executor:
+            self._encode_executor.shutdown(wait=False)
 
     def _add_background_task(self, coro: Coroutine):
         """Add a background task with automatic cleanup"""
@@ -591,22 +750,48 @@ class VideoRoom:
 
         # Participants (same pattern as robotics)
         self.producer: str | None = None
-        self.consumers: list[str] = []
+        # Insertion-ordered set: O(1) membership/removal, stable join order
+        self.consumers: dict[str, None] = {}
+        # Broadcast recipients (producer first), rebuilt only when membership changes
+        self.participants: tuple[str, ...] = ()
 
-        # Video state
-        self.last_frame: bytes | None = None
+        # Video state (latest encoded frame is shared by all consumer tracks)
+        self.latest_frame = LatestFrameSlot()
         self.frame_count = 0
         self.total_bytes = 0
         self.start_time = datetime.now(tz=UTC)
         self.last_frame_time: datetime | None = None
 
-        # Activity tracking
+        # Activity tracking (last_activity is a time.monotonic() reading: it is
+        # stamped on every message and frame and only ever compared)
         self.created_at = datetime.now(tz=UTC)
-        self.last_activity = datetime.now(tz=UTC)
+        self.last_activity = time.monotonic()
+
+    def refresh_participants(self):
+        """Rebuild the broadcast recipient tuple after a join/leave"""
+        producer = (self.producer,) if self.producer else ()
+        self.participants = producer + tuple(self.consumers)
+
+    def participant_info(self) -> ParticipantInfoDict:
+        """Participant summary, with the total read off the recipient tuple"""
+        return {
+            "producer": self.producer,
+            "consumers": tuple(self.consumers),
+            "total": len(self.participants),
+        }
 
 
 # ============= VIDEO CORE (main class) =============
 
+# VideoConfig fields a producer may change through VIDEO_CONFIG_UPDATE
+VIDEO_CONFIG_UPDATE_FIELDS = (
+    "resolution",
+    "framerate",
+    "quality",
+    "encoding",
+    "bitrate",
+)
+
 
 class VideoCore:
     """Core video system"""
@@ -615,10 +800,26 @@ class VideoCore:
         # Nested structure: workspace_id -> room_id -> VideoRoom
         self.workspaces: dict[str, dict[str, VideoRoom]] = {}
         self.websocket_connections: dict[str, WebSocket] = {}
+        # Per-connection outbound queues, drained by one writer task per socket
+        self.outbound_queues: dict[str, asyncio.Queue[str]] = {}
         self.webrtc_connections: dict[str, WebRTCConnection] = {}
         self.connection_metadata: dict[str, dict] = {}
         # Track background tasks to prevent garbage collection
         self.background_tasks: set = set()
+        # (iso string, monotonic seconds) - shared by messages built within 1ms
+        self._ts_cache: tuple[str, float] = ("", float("-inf"))
+        # Incoming WebSocket message type -> handler, one dict lookup per message.
+        # Keyed by the plain str values: parsed JSON strings hash/compare against
+        # those without going through the StrEnum subclass
+        self._ws_handlers: dict[str, Callable[..., None]] = {
+            MessageType.STREAM_STARTED.value: self._on_stream_started,
+            MessageType.STREAM_STOPPED.value: self._on_stream_stopped,
+            MessageType.VIDEO_CONFIG_UPDATE.value: self._on_config_update,
+            MessageType.STATUS_UPDATE.value: self._on_status,
+            MessageType.STREAM_STATS.value: self._on_stats,
+            MessageType.EMERGENCY_STOP.value: self._on_estop,
+            MessageType.RECOVERY_TRIGGERED.value: self._on_recovery,
+        }
 
         # Cleanup configuration
         self.inactivity_timeout = timedelta(hours=1)  # 1 hour of inactivity
@@ -649,7 +850,8 @@ class VideoCore:
 
     async def _cleanup_inactive_rooms(self):
         """Remove rooms that have been inactive for more than the timeout period"""
-        current_time = datetime.now(tz=UTC)
+        current_time = time.monotonic()
+        timeout_seconds = self.inactivity_timeout.total_seconds()
         rooms_to_remove = []
 
         for workspace_id, rooms in self.workspaces.items():
@@ -675,11 +877,11 @@ class VideoCore:
                 if not has_active_connections:
                     time_since_activity = current_time - room_last_activity
 
-                    if time_since_activity > self.inactivity_timeout:
+                    if time_since_activity > timeout_seconds:
                         rooms_to_remove.append((workspace_id, room_id))
                         logger.info(
                             f"Marking video room {room_id} in workspace {workspace_id} for cleanup "
-                            f"(inactive for {time_since_activity})"
+                            f"(inactive for {timedelta(seconds=time_since_activity)})"
                         )
 
         # Remove inactive rooms
@@ -692,11 +894,22 @@ class VideoCore:
         if rooms_to_remove:
             logger.info(f"Cleaned up {len(rooms_to_remove)} inactive video rooms")
 
+    def _now_iso(self) -> str:
+        """Current UTC timestamp as ISO string, reused for up to 1ms"""
+        # Age measured on the monotonic clock so a wall-clock step back cannot
+        # pin the cached string
+        t = time.monotonic()
+        if t - self._ts_cache[1] < 0.001:
+            return self._ts_cache[0]
+        s = datetime.now(tz=UTC).isoformat()
+        self._ts_cache = (s, t)
+        return s
+
     def _update_room_activity(self, workspace_id: str, room_id: str):
         """Update the last activity timestamp for a room"""
         room = self._get_room(workspace_id, room_id)
         if room:
-            room.last_activity = datetime.now(tz=UTC)
+            room.last_activity = time.monotonic()
 
     # ============= ROOM MANAGEMENT (same pattern as robotics) =============
 
@@ -734,14 +947,10 @@ class VideoCore:
             {
                 "id": room.id,
                 "workspace_id": room.workspace_id,
-                "participants": {
-                    "producer": room.producer,
-                    "consumers": room.consumers,
-                    "total": len(room.consumers) + (1 if room.producer else 0),
-                },
+                "participants": room.participant_info(),
                 "frame_count": room.frame_count,
                 "config": {
-                    "resolution": room.config.resolution,
+                    "resolution": resolution_to_dict(room.config.resolution),
                     "framerate": room.config.framerate,
                     # "encoding": room.config.encoding.value
                     # if room.config.encoding
@@ -786,15 +995,11 @@ class VideoCore:
         return {
             "room_id": room_id,
             "workspace_id": workspace_id,
-            "participants": {
-                "producer": room.producer,
-                "consumers": room.consumers,
-                "total": len(room.consumers) + (1 if room.producer else 0),
-            },
+            "participants": room.participant_info(),
             "frame_count": room.frame_count,
             "last_frame_time": room.last_frame_time,
             "current_config": {
-                "resolution": room.config.resolution,
+                "resolution": resolution_to_dict(room.config.resolution),
                 "framerate": room.config.framerate,
                 "encoding": room.config.encoding.value
                 if room.config.encoding
@@ -802,7 +1007,7 @@ class VideoCore:
                 "bitrate": room.config.bitrate,
                 "quality": room.config.quality,
             },
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": self._now_iso(),
         }
 
     def get_room_info(self, workspace_id: str, room_id: str) -> dict:
@@ -814,14 +1019,10 @@ class VideoCore:
         return {
             "id": room.id,
             "workspace_id": room.workspace_id,
-            "participants": {
-                "producer": room.producer,
-                "consumers": room.consumers,
-                "total": len(room.consumers) + (1 if room.producer else 0),
-            },
+            "participants": room.participant_info(),
             "frame_count": room.frame_count,
             "config": {
-                "resolution": room.config.resolution,
+                "resolution": resolution_to_dict(room.config.resolution),
                 "framerate": room.config.framerate,
                 "encoding": room.config.encoding.value
                 if room.config.encoding
@@ -856,16 +1057,15 @@ class VideoCore:
         if role == ParticipantRole.PRODUCER:
             if room.producer is None:
                 room.producer = participant_id
+                room.refresh_participants()
                 self._update_room_activity(workspace_id, room_id)
                 logger.info(
                     f"Producer {participant_id} joined video room {room_id} in workspace {workspace_id}"
                 )
 
                 # Broadcast producer join to existing consumers
-                self._add_background_task(
-                    self._broadcast_participant_joined(
-                        workspace_id, room_id, participant_id, role
-                    )
+                self._broadcast_participant_joined(
+                    workspace_id, room_id, participant_id, role
                 )
                 return True
             logger.warning(
@@ -875,17 +1075,16 @@ class VideoCore:
 
         if role == ParticipantRole.CONSUMER:
             if participant_id not in room.consumers:
-                room.consumers.append(participant_id)
+                room.consumers[participant_id] = None
+                room.refresh_participants()
                 self._update_room_activity(workspace_id, room_id)
                 logger.info(
                     f"Consumer {participant_id} joined video room {room_id} in workspace {workspace_id}"
                 )
 
                 # Broadcast consumer join to producer and other consumers
-                self._add_background_task(
-                    self._broadcast_participant_joined(
-                        workspace_id, room_id, participant_id, role
-                    )
+                self._broadcast_participant_joined(
+                    workspace_id, room_id, participant_id, role
                 )
                 return True
             return False
@@ -906,7 +1105,7 @@ class VideoCore:
                 f"Producer {participant_id} left video room {room_id} in workspace {workspace_id}"
             )
         elif participant_id in room.consumers:
-            room.consumers.remove(participant_id)
+            del room.consumers[participant_id]
             role = ParticipantRole.CONSUMER
             logger.info(
                 f"Consumer {participant_id} left video room {room_id} in workspace {workspace_id}"
@@ -914,10 +1113,11 @@ class VideoCore:
 
         # Broadcast participant left event
         if role:
-            self._add_background_task(
-                self._broadcast_participant_left(
-                    workspace_id, room_id, participant_id, role
-                )
+            room.refresh_participants()
+            # Inactivity is measured from the last departure
+            room.last_activity = time.monotonic()
+            self._broadcast_participant_left(
+                workspace_id, room_id, participant_id, role
             )
 
     # ============= WEBRTC HANDLING =============
@@ -927,7 +1127,7 @@ class VideoCore:
         workspace_id: str,
         room_id: str,
         client_id: str,
-        message: RawWebRTCSignalingMessage,
+        message: RawWebRTCSignal,
         participant_role: str | None = None,
     ):
         """Handle WebRTC signaling for peer-to-peer connections"""
@@ -938,9 +1138,9 @@ class VideoCore:
             msg = f"Room {room_id} not found in workspace {workspace_id}"
             raise ValueError(msg)
 
-        if message["type"] == RawWebRTCMessageType.OFFER:
+        if isinstance(message, RawWebRTCOffer):
             # Check if this is a targeted offer from producer to consumer
-            target_consumer = message.get("target_consumer")
+            target_consumer = message.target_consumer
 
             if target_consumer and participant_role == "producer":
                 # Producer sending offer to specific consumer - forward it
@@ -950,12 +1150,12 @@ class VideoCore:
 
                 output_message: WebRTCOfferMessageDict = {
                     "type": MessageType.WEBRTC_OFFER,
-                    "offer": {"type": "offer", "sdp": message["sdp"]},
+                    "offer": {"type": "offer", "sdp": message.sdp},
                     "from_producer": client_id,
-                    "timestamp": datetime.now(tz=UTC).isoformat(),
+                    "timestamp": self._now_iso(),
                 }
 
-                await self._send_to_participant(target_consumer, output_message)
+                self._send_to_participant(target_consumer, output_message)
                 return {"success": True, "message": "Offer forwarded to consumer"}
 
             # For peer-to-peer, we don't handle server-side WebRTC connections
@@ -967,10 +1167,10 @@ class VideoCore:
                 "message": "Peer-to-peer mode - no server WebRTC processing",
             }
 
-        if message["type"] == RawWebRTCMessageType.ANSWER:
+        if isinstance(message, RawWebRTCAnswer):
             # Handle answer from consumer back to producer
             from_consumer = client_id
-            target_producer = message.get("target_producer")
+            target_producer = message.target_producer
 
             if target_producer:
                 logger.info(
@@ -979,43 +1179,37 @@ class VideoCore:
 
                 output_message: WebRTCAnswerMessageDict = {
                     "type": MessageType.WEBRTC_ANSWER,
-                    "answer": {"type": "answer", "sdp": message["sdp"]},
+                    "answer": {"type": "answer", "sdp": message.sdp},
                     "from_consumer": from_consumer,
-                    "timestamp": datetime.now(tz=UTC).isoformat(),
+                    "timestamp": self._now_iso(),
                 }
 
-                await self._send_to_participant(target_producer, output_message)
+                self._send_to_participant(target_producer, output_message)
                 return {"success": True, "message": "Answer forwarded to producer"}
 
-        elif message["type"] == RawWebRTCMessageType.ICE:
+        elif isinstance(message, RawWebRTCIce):
             # Forward ICE candidates between peers
-            target_consumer = message.get("target_consumer")
-            target_producer = message.get("target_producer")
+            target_consumer = message.target_consumer
+            target_producer = message.target_producer
 
             if target_consumer and participant_role == "producer":
-                output_message: WebRTCIceMessageDict = {
-                    "type": MessageType.WEBRTC_ICE,
-                    "candidate": message["candidate"],
-                    "from_producer": client_id,
-                    "from_consumer": None,
-                    "timestamp": datetime.now(tz=UTC).isoformat(),
-                }
-
-                await self._send_to_participant(target_consumer, output_message)
+                payload = _ICE_FROM_PRODUCER_TEMPLATE % (
+                    _dumps(message.candidate),
+                    _dumps(client_id),
+                    self._now_iso(),
+                )
+                self._send_raw(target_consumer, payload)
                 return {
                     "success": True,
                     "message": "ICE candidate forwarded to consumer",
                 }
             if target_producer and participant_role == "consumer":
-                output_message: WebRTCIceMessageDict = {
-                    "type": MessageType.WEBRTC_ICE,
-                    "candidate": message["candidate"],
-                    "from_producer": None,
-                    "from_consumer": client_id,
-                    "timestamp": datetime.now(tz=UTC).isoformat(),
-                }
-
-                await self._send_to_participant(target_producer, output_message)
+                payload = _ICE_FROM_CONSUMER_TEMPLATE % (
+                    _dumps(message.candidate),
+                    _dumps(client_id),
+                    self._now_iso(),
+                )
+                self._send_raw(target_producer, payload)
                 return {
                     "success": True,
                     "message": "ICE candidate forwarded to producer",
@@ -1031,20 +1225,18 @@ class VideoCore:
         if not room:
             return 0
 
-        consumer_count = 0
-        for consumer_id in room.consumers:
-            consumer_conn = self.webrtc_connections.get(consumer_id)
-            if consumer_conn and consumer_conn.is_consumer:
-                try:
-                    consumer_conn.send_video_frame(frame_data)
-                    consumer_count += 1
-                except Exception:
-                    logger.exception(f"Error sending frame to {consumer_id}")
+        # O(1) regardless of consumer count: every consumer track reads this slot
+        room.latest_frame.publish(frame_data)
+        room.frame_count += 1
+        room.total_bytes += len(frame_data)
+        room.last_frame_time = datetime.now(tz=UTC)
 
+        consumer_count = len(room.consumers)
         if consumer_count > 0:
-            # Update room activity when frames are being broadcast
-            self._update_room_activity(workspace_id, room_id)
-            logger.debug(f"Broadcasted frame to {consumer_count} consumers")
+            # Update room activity when frames are being broadcast (room already
+            # looked up, and the debug message is only formatted when enabled)
+            room.last_activity = time.monotonic()
+            logger.debug("Broadcasted frame to %d consumers", consumer_count)
 
         return consumer_count
 
@@ -1058,11 +1250,11 @@ class VideoCore:
 
         participant_id: str | None = None
         role: ParticipantRole | None = None
+        writer: asyncio.Task | None = None
 
         try:
             # Get join message
-            data = await websocket.receive_text()
-            join_msg = json.loads(data)
+            join_msg = _loads(await self._receive_frame(websocket))
 
             participant_id = join_msg["participant_id"]
             role = ParticipantRole(join_msg["role"])
@@ -1073,9 +1265,9 @@ class VideoCore:
                     "type": MessageType.ERROR,
                     "message": "Cannot join room",
                     "code": None,
-                    "timestamp": datetime.now(tz=UTC).isoformat(),
+                    "timestamp": self._now_iso(),
                 }
-                await websocket.send_text(json.dumps(error_message))
+                await websocket.send_text(_dumps(error_message))
                 await websocket.close()
                 return
 
@@ -1086,47 +1278,74 @@ class VideoCore:
                 "participant_id": participant_id,
                 "role": role,
                 "connected_at": datetime.now(tz=UTC),
-                "last_activity": datetime.now(tz=UTC),
+                "last_activity": time.monotonic(),
                 "message_count": 0,
+                "handler": asyncio.current_task(),
+                "overflowed": False,  # Set by _send_raw before it cancels the handler
             }
 
+            # All sends to this participant go through its writer task
+            outbound_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=1024)
+            self.outbound_queues[participant_id] = outbound_queue
+            writer = asyncio.create_task(
+                self._writer_loop(participant_id, websocket, outbound_queue)
+            )
+
             # Send join confirmation
             joined_message: JoinedMessageDict = {
                 "type": MessageType.JOINED,
                 "room_id": room_id,
                 "role": role,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
+                "timestamp": self._now_iso(),
             }
-            await websocket.send_text(json.dumps(joined_message))
+            self._send_to_participant(participant_id, joined_message)
 
             # Handle messages
-            async for message in websocket.iter_text():
+            while True:
+                raw = await self._receive_frame(websocket)
                 try:
-                    msg = json.loads(message)
+                    msg = _loads(raw)
                     await self._handle_websocket_message(
                         workspace_id, room_id, participant_id, role, msg
                     )
-                except json.JSONDecodeError:
+                except _JSONDecodeError:
                     logger.exception(f"Invalid JSON from {participant_id}")
                 except Exception:
                     logger.exception("WebSocket message error")
 
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected: {participant_id}")
+        except asyncio.CancelledError:
+            metadata = self.connection_metadata.get(participant_id)
+            if metadata is None or not metadata["overflowed"]:
+                raise
+            # Our own overflow cancel: clear it and finish like a disconnect
+            asyncio.current_task().uncancel()
+            logger.info(f"WebSocket dropped after queue overflow: {participant_id}")
         except Exception:
             logger.exception("WebSocket error")
         finally:
             # Cleanup
+            if writer:
+                writer.cancel()
             if participant_id:
-                metadata = self.connection_metadata.get(participant_id)
-                if metadata:
+                metadata = self.connection_metadata.pop(participant_id, None)
+                if metadata is not None:
                     self.leave_room(
                         metadata["workspace_id"], metadata["room_id"], participant_id
                     )
-                if participant_id in self.websocket_connections:
-                    del self.websocket_connections[participant_id]
-                if participant_id in self.connection_metadata:
-                    del self.connection_metadata[participant_id]
+                self.websocket_connections.pop(participant_id, None)
+                self.outbound_queues.pop(participant_id, None)
+
+    @staticmethod
+    async def _receive_frame(websocket: WebSocket) -> str | bytes:
+        """Next text or binary frame payload; raises WebSocketDisconnect on close"""
+        # Raw ASGI receive: _loads parses either payload type directly
+        frame = await websocket.receive()
+        if frame["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(frame.get("code", 1000), frame.get("reason"))
+        raw = frame.get("text")
+        return raw if raw is not None else frame.get("bytes")
 
     async def _handle_websocket_message(
         self,
@@ -1138,176 +1357,228 @@ class VideoCore:
     ):
         """Handle incoming WebSocket message"""
         # Update activity tracking
-        if participant_id in self.connection_metadata:
-            self.connection_metadata[participant_id]["last_activity"] = datetime.now(
-                tz=UTC
-            )
-            self.connection_metadata[participant_id]["message_count"] += 1
+        metadata = self.connection_metadata.get(participant_id)
+        if metadata is not None:
+            metadata["last_activity"] = time.monotonic()
+            metadata["message_count"] += 1
+
+        # Heartbeats dominate idle connections: answer with a pre-serialized ack,
+        # skipping the room lookup and dispatch (connection activity is enough)
+        if message["type"] == HEARTBEAT_TYPE:
+            self._send_raw(participant_id, encode_heartbeat_ack(self._now_iso()))
+            return
 
         # Update room activity
         self._update_room_activity(workspace_id, room_id)
 
-        # Handle heartbeat
-        if message["type"] == MessageType.HEARTBEAT:
-            heartbeat_ack: HeartbeatAckMessageDict = {
-                "type": MessageType.HEARTBEAT_ACK,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._send_to_participant(participant_id, heartbeat_ack)
+        handler = self._ws_handlers.get(message["type"])
+        if handler is not None:
+            handler(workspace_id, room_id, participant_id, role, message)
             return
 
-        # Handle stream started notification
-        if message["type"] == MessageType.STREAM_STARTED:
-            logger.info(
-                f"Stream started by {participant_id} in room {room_id} (workspace {workspace_id})"
-            )
-            config = message.get("config", {})
+        # Log unhandled message types
+        logger.info(f"Unhandled message type {message['type']} from {participant_id}")
 
-            # Broadcast to other participants
-            broadcast_message: StreamStartedMessageDict = {
-                "type": MessageType.STREAM_STARTED,
-                "config": config,
-                "participant_id": participant_id,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+    def _on_stream_started(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle stream started notification"""
+        logger.info(
+            f"Stream started by {participant_id} in room {room_id} (workspace {workspace_id})"
+        )
+        config = message.get("config", {})
 
-        # Handle stream stopped notification
-        if message["type"] == MessageType.STREAM_STOPPED:
-            logger.info(
-                f"Stream stopped by {participant_id} in room {room_id} (workspace {workspace_id})"
-            )
-            reason = message.get("reason")
+        # Broadcast to other participants
+        broadcast_message: StreamStartedMessageDict = {
+            "type": MessageType.STREAM_STARTED,
+            "config": config,
+            "participant_id": participant_id,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
 
-            # Broadcast to other participants
-            broadcast_message: StreamStoppedMessageDict = {
-                "type": MessageType.STREAM_STOPPED,
-                "participant_id": participant_id,
-                "reason": reason,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+    def _on_stream_stopped(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle stream stopped notification"""
+        logger.info(
+            f"Stream stopped by {participant_id} in room {room_id} (workspace {workspace_id})"
+        )
+        reason = message.get("reason")
 
-        # Handle video config update
-        if message["type"] == MessageType.VIDEO_CONFIG_UPDATE:
-            logger.info(
-                f"Video config updated by {participant_id} in room {room_id} (workspace {workspace_id})"
-            )
-            config = message.get("config", {})
-
-            # Update room config if producer
-            if role == ParticipantRole.PRODUCER:
-                room = self._get_room(workspace_id, room_id)
-                if room:
-                    # Update room's video config
-                    if "resolution" in config:
-                        room.config.resolution = config["resolution"]
-                    if "framerate" in config:
-                        room.config.framerate = config["framerate"]
-                    if "quality" in config:
-                        room.config.quality = config["quality"]
-                    if "encoding" in config:
-                        room.config.encoding = config["encoding"]
-                    if "bitrate" in config:
-                        room.config.bitrate = config["bitrate"]
-
-            # Broadcast to other participants
-            broadcast_message: VideoConfigUpdateMessageDict = {
-                "type": MessageType.VIDEO_CONFIG_UPDATE,
-                "config": config,
-                "source": participant_id,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+        # Broadcast to other participants
+        broadcast_message: StreamStoppedMessageDict = {
+            "type": MessageType.STREAM_STOPPED,
+            "participant_id": participant_id,
+            "reason": reason,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
 
-        # Handle status update
-        if message["type"] == MessageType.STATUS_UPDATE:
-            logger.info(
-                f"Status update from {participant_id} in room {room_id} (workspace {workspace_id})"
-            )
-            status = message.get("status", "unknown")
-            data = message.get("data")
-
-            # Broadcast to other participants
-            broadcast_message: StatusUpdateMessageDict = {
-                "type": MessageType.STATUS_UPDATE,
-                "status": status,
-                "data": data,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+    def _on_config_update(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle video config update"""
+        logger.info(
+            f"Video config updated by {participant_id} in room {room_id} (workspace {workspace_id})"
+        )
+        config = message.get("config", {})
 
-        # Handle stream stats
-        if message["type"] == MessageType.STREAM_STATS:
-            logger.debug(
-                f"Stream stats from {participant_id} in room {room_id} (workspace {workspace_id})"
-            )
-            stats = message.get("stats", {})
+        # Update room config if producer
+        if role == ParticipantRole.PRODUCER:
+            room = self._get_room(workspace_id, room_id)
+            if room:
+                # Update room's video config (frozen model: swap in an updated copy)
+                updates = {
+                    field: config[field]
+                    for field in VIDEO_CONFIG_UPDATE_FIELDS
+                    if field in config
+                }
+                if updates:
+                    # Validate so wire values (e.g. a resolution dict) get model types
+                    try:
+                        room.config = VideoConfig.model_validate(
+                            room.config.model_dump() | updates
+                        )
+                    except ValidationError:
+                        logger.warning(
+                            f"Ignoring invalid video config from {participant_id}: {config}"
+                        )
 
-            # Broadcast to other participants (typically from producer to consumers)
-            broadcast_message: StreamStatsMessageDict = {
-                "type": MessageType.STREAM_STATS,
-                "stats": stats,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+        # Broadcast to other participants
+        broadcast_message: VideoConfigUpdateMessageDict = {
+            "type": MessageType.VIDEO_CONFIG_UPDATE,
+            "config": config,
+            "source": participant_id,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
 
-        # Handle emergency stop
-        if message["type"] == MessageType.EMERGENCY_STOP:
-            reason = message.get("reason", "Emergency stop triggered")
-            logger.warning(
-                f"Emergency stop by {participant_id} in room {room_id} (workspace {workspace_id}): {reason}"
-            )
+    def _on_status(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle status update"""
+        logger.info(
+            f"Status update from {participant_id} in room {room_id} (workspace {workspace_id})"
+        )
+        status = message.get("status", "unknown")
+        data = message.get("data")
+
+        # Broadcast to other participants
+        broadcast_message: StatusUpdateMessageDict = {
+            "type": MessageType.STATUS_UPDATE,
+            "status": status,
+            "data": data,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
 
-            # Broadcast to all participants
-            broadcast_message: EmergencyStopMessageDict = {
-                "type": MessageType.EMERGENCY_STOP,
-                "reason": reason,
-                "source": participant_id,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(workspace_id, room_id, broadcast_message)
-            return
+    def _on_stats(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle stream stats"""
+        # High-rate telemetry: only format the debug line when DEBUG is enabled
+        logger.debug(
+            "Stream stats from %s in room %s (workspace %s)",
+            participant_id,
+            room_id,
+            workspace_id,
+        )
+        stats = message.get("stats", {})
 
-        # Handle recovery triggered (from consumer typically)
-        if message["type"] == MessageType.RECOVERY_TRIGGERED:
-            policy = message.get("policy")
-            reason = message.get("reason", "Recovery triggered")
-            logger.info(
-                f"Recovery triggered by {participant_id} in room {room_id} (workspace {workspace_id}): {policy} - {reason}"
-            )
+        # Broadcast to other participants (typically from producer to consumers)
+        broadcast_message: StreamStatsMessageDict = {
+            "type": MessageType.STREAM_STATS,
+            "stats": stats,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
 
-            # Broadcast to other participants
-            broadcast_message: RecoveryTriggeredMessageDict = {
-                "type": MessageType.RECOVERY_TRIGGERED,
-                "policy": policy,
-                "reason": reason,
-                "timestamp": datetime.now(tz=UTC).isoformat(),
-            }
-            await self._broadcast_to_room(
-                workspace_id, room_id, broadcast_message, exclude=participant_id
-            )
-            return
+    def _on_estop(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle emergency stop"""
+        reason = message.get("reason", "Emergency stop triggered")
+        logger.warning(
+            f"Emergency stop by {participant_id} in room {room_id} (workspace {workspace_id}): {reason}"
+        )
 
-        # Log unhandled message types
-        logger.info(f"Unhandled message type {message['type']} from {participant_id}")
+        # Broadcast to all participants
+        broadcast_message: EmergencyStopMessageDict = {
+            "type": MessageType.EMERGENCY_STOP,
+            "reason": reason,
+            "source": participant_id,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(workspace_id, room_id, broadcast_message)
 
-    async def _broadcast_to_room(
+    def _on_recovery(
+        self,
+        workspace_id: str,
+        room_id: str,
+        participant_id: str,
+        role: ParticipantRole,
+        message: WebSocketMessageDict,
+    ):
+        """Handle recovery triggered (from consumer typically)"""
+        policy = message.get("policy")
+        reason = message.get("reason", "Recovery triggered")
+        logger.info(
+            f"Recovery triggered by {participant_id} in room {room_id} (workspace {workspace_id}): {policy} - {reason}"
+        )
+
+        # Broadcast to other participants
+        broadcast_message: RecoveryTriggeredMessageDict = {
+            "type": MessageType.RECOVERY_TRIGGERED,
+            "policy": policy,
+            "reason": reason,
+            "timestamp": self._now_iso(),
+        }
+        self._broadcast_to_room(
+            workspace_id, room_id, broadcast_message, exclude=participant_id
+        )
+
+    def _broadcast_to_room(
         self,
         workspace_id: str,
         room_id: str,
@@ -1319,31 +1590,69 @@ class VideoCore:
         if not room:
             return
 
-        participants = []
-        if room.producer:
-            participants.append(room.producer)
-        participants.extend(room.consumers)
+        # Immutable snapshot: a join/leave mid-broadcast swaps in a new tuple
+        participants = room.participants
+        if not participants or participants == (exclude,):
+            return
 
+        # Serialize once; each socket's writer task sends independently, so one
+        # slow socket doesn't delay the others
+        payload = _dumps(message)
         for participant_id in participants:
-            if exclude and participant_id == exclude:
-                continue
-            await self._send_to_participant(participant_id, message)
+            if participant_id != exclude:
+                self._send_raw(participant_id, payload)
 
-    async def _send_to_participant(
-        self, participant_id: str, message: WebSocketMessageDict
-    ):
+    def _send_to_participant(self, participant_id: str, message: WebSocketMessageDict):
         """Send message to specific participant"""
-        if participant_id in self.websocket_connections:
-            try:
-                await self.websocket_connections[participant_id].send_text(
-                    json.dumps(message)
-                )
-            except Exception:
-                logger.exception(f"Error sending message to {participant_id}")
-                if participant_id in self.websocket_connections:
-                    del self.websocket_connections[participant_id]
+        self._send_raw(participant_id, _dumps(message))
 
-    async def _broadcast_participant_joined(
+    def _send_raw(self, participant_id: str, payload: str):
+        """Queue an already serialized message for specific participant"""
+        queue = self.outbound_queues.get(participant_id)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            # Dropping would leave the client connected with stale state (a missed
+            # emergency_stop or participant_left): disconnect it so it resyncs
+            logger.warning(
+                f"Outbound queue full for {participant_id}, closing connection"
+            )
+            # A close frame would wait behind the backlog, so end the connection's
+            # handler instead: its cleanup leaves the room and uvicorn closes the socket
+            del self.outbound_queues[participant_id]
+            metadata = self.connection_metadata.get(participant_id)
+            if metadata is not None and not metadata["overflowed"]:
+                metadata["overflowed"] = True
+                metadata["handler"].cancel()
+
+    async def _writer_loop(
+        self, participant_id: str, websocket: WebSocket, queue: asyncio.Queue[str]
+    ):
+        """Drain a participant's outbound queue onto its WebSocket"""
+        try:
+            while True:
+                batch = [await queue.get()]
+                # Take whatever queued up meanwhile without another wakeup
+                while len(batch) < 64 and not queue.empty():
+                    batch.append(queue.get_nowait())
+                # Nagle is already off: asyncio and uvloop set TCP_NODELAY on every
+                # TCP transport. The raw socket isn't reachable through Starlette,
+                # so frames aren't corked together here.
+                for payload in batch:
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"Error sending message to {participant_id}")
+            # Stop queueing for this socket; connection_metadata stays until the
+            # handler's finally so leave_room still runs on disconnect
+            if self.outbound_queues.get(participant_id) is queue:
+                del self.outbound_queues[participant_id]
+            self.websocket_connections.pop(participant_id, None)
+
+    def _broadcast_participant_joined(
         self,
         workspace_id: str,
         room_id: str,
@@ -1352,30 +1661,22 @@ class VideoCore:
     ):
         """Broadcast participant joined event to other participants in the room"""
         room = self._get_room(workspace_id, room_id)
-        if not room:
-            return
-
-        participants: list[str] = []
-        if room.producer:
-            participants.append(room.producer)
-        participants.extend(room.consumers)
+        if not room or len(room.participants) <= 1:
+            return  # Only the joining participant is in the room
 
         participant_joined_message: ParticipantJoinedMessageDict = {
             "type": MessageType.PARTICIPANT_JOINED,
             "room_id": room_id,
             "participant_id": participant_id,
             "role": role,
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": self._now_iso(),
         }
 
-        for other_participant_id in participants:
-            if other_participant_id == participant_id:
-                continue
-            await self._send_to_participant(
-                other_participant_id, participant_joined_message
-            )
+        self._broadcast_to_room(
+            workspace_id, room_id, participant_joined_message, exclude=participant_id
+        )
 
-    async def _broadcast_participant_left(
+    def _broadcast_participant_left(
         self,
         workspace_id: str,
         room_id: str,
@@ -1384,28 +1685,20 @@ class VideoCore:
     ):
         """Broadcast participant left event to other participants in the room"""
         room = self._get_room(workspace_id, room_id)
-        if not room:
-            return
-
-        participants: list[str] = []
-        if room.producer:
-            participants.append(room.producer)
-        participants.extend(room.consumers)
+        if not room or not room.participants:
+            return  # Room is empty now that the participant has left
 
         participant_left_message: dict = {
             "type": MessageType.PARTICIPANT_LEFT,
             "room_id": room_id,
             "participant_id": participant_id,
             "role": role,
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": self._now_iso(),
         }
 
-        for other_participant_id in participants:
-            if other_participant_id == participant_id:
-                continue
-            await self._send_to_participant(
-                other_participant_id, participant_left_message
-            )
+        self._broadcast_to_room(
+            workspace_id, room_id, participant_left_message, exclude=participant_id
+        )
 
     def _add_background_task(self, coro: Coroutine):
         """Add a background task with automatic cleanup"""
@@ -1428,12 +1721,13 @@ class VideoCore:
             "rooms_before": rooms_before,
             "rooms_after": rooms_after,
             "rooms_removed": rooms_before - rooms_after,
-            "timestamp": datetime.now(tz=UTC).isoformat(),
+            "timestamp": self._now_iso(),
         }
 
     def get_cleanup_status(self) -> dict:
         """Get cleanup system status and configuration"""
         current_time = datetime.now(tz=UTC)
+        current_monotonic = time.monotonic()
 
         # Calculate room ages and activity
         room_info = []
@@ -1453,7 +1747,7 @@ class VideoCore:
                             latest_activity = metadata["last_activity"]
 
                 age = current_time - room.created_at
-                inactivity = current_time - latest_activity
+                inactivity = timedelta(seconds=current_monotonic - latest_activity)
 
                 room_info.append({
                     "workspace_id": workspace_id,
@@ -1,11 +1,8 @@
 import enum
-import logging
 from datetime import datetime
-from typing import Any, Literal, TypedDict
+from typing import Annotated, Any, Literal, NamedTuple, TypedDict
 
-from pydantic import BaseModel, Field
-
-logger = logging.getLogger(__name__)
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_serializer
 
 # ============= ENUMS =============
 
@@ -102,7 +99,7 @@ class ParticipantInfoDict(TypedDict):
     """Information about room participants"""
 
     producer: str | None
-    consumers: list[str]
+    consumers: tuple[str, ...]
     total: int
 
 
@@ -127,6 +124,9 @@ class RTCIceCandidateDict(TypedDict, total=False):
 
 # ============= BASE MESSAGE STRUCTURES =============
 
+# WebSocket messages are TypedDicts only: built as plain dict literals and
+# serialized directly, with no Pydantic model or validation on the send path
+
 
 class BaseWebSocketMessage(TypedDict):
     """Base WebSocket message structure"""
@@ -169,6 +169,16 @@ class HeartbeatAckMessageDict(BaseWebSocketMessage):
     type: Literal[MessageType.HEARTBEAT_ACK]
 
 
+# Serialized HeartbeatAckMessageDict halves; only the timestamp varies
+_HEARTBEAT_ACK_PREFIX = f'{{"type":"{MessageType.HEARTBEAT_ACK}","timestamp":"'
+_HEARTBEAT_ACK_SUFFIX = '"}'
+
+
+def encode_heartbeat_ack(timestamp: str) -> str:
+    """Serialized heartbeat ack for an ISO timestamp, without a JSON encoder pass"""
+    return _HEARTBEAT_ACK_PREFIX + timestamp + _HEARTBEAT_ACK_SUFFIX
+
+
 # ============= VIDEO STREAMING MESSAGES =============
 
 
@@ -233,7 +243,7 @@ class StatusUpdateMessageDict(BaseWebSocketMessage):
 
     type: Literal[MessageType.STATUS_UPDATE]
     status: str
-    data: dict[str, Any] | None
+    data: dict[str, Any] | None  # Free-form; relayed as-is, not validated
 
 
 class ParticipantJoinedMessageDict(BaseWebSocketMessage):
@@ -355,26 +365,55 @@ WebSocketMessageDict = (
 # ============= PYDANTIC MODELS (API INPUT/OUTPUT ONLY) =============
 
 
+class Resolution(NamedTuple):
+    """Frame size; sent as {"width": ..., "height": ...} on the wire"""
+
+    width: int
+    height: int
+
+
+def resolution_to_dict(resolution: Resolution | None) -> dict[str, int] | None:
+    """Wire (VideoConfigDict) form of a resolution"""
+    return resolution._asdict() if resolution is not None else None
+
+
+# Shared immutable defaults, reused by every instance without copying
+DEFAULT_RESOLUTION = Resolution(640, 480)
+DEFAULT_INFO_FRAME_BG_COLOR = (20, 30, 60)
+DEFAULT_INFO_FRAME_TEXT_COLOR = (200, 200, 200)
+
+
 class VideoConfig(BaseModel):
     """Video processing configuration"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     encoding: VideoEncoding | None = Field(default=VideoEncoding.VP8)
-    resolution: dict[str, int] | None = Field(default={"width": 640, "height": 480})
+    resolution: Resolution | None = Field(
+        default=DEFAULT_RESOLUTION,
+        json_schema_extra={"default": resolution_to_dict(DEFAULT_RESOLUTION)},
+    )
     framerate: int | None = Field(default=30, ge=1, le=120)
     bitrate: int | None = Field(default=1000000, ge=100000)
     quality: int | None = Field(default=80, ge=1, le=100)
 
+    @field_serializer("resolution")
+    def _serialize_resolution(self, resolution: Resolution | None):
+        return resolution_to_dict(resolution)
+
 
 class RecoveryConfig(BaseModel):
     """Video frame recovery configuration"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     frame_timeout_ms: int = Field(default=100, ge=10, le=1000)
     max_frame_reuse_count: int = Field(default=3, ge=1, le=10)
     recovery_policy: RecoveryPolicy = RecoveryPolicy.FREEZE_LAST_FRAME
     fallback_policy: RecoveryPolicy = RecoveryPolicy.CONNECTION_INFO
     show_hold_indicators: bool = True
-    info_frame_bg_color: tuple[int, int, int] = (20, 30, 60)
-    info_frame_text_color: tuple[int, int, int] = (200, 200, 200)
+    info_frame_bg_color: tuple[int, int, int] = DEFAULT_INFO_FRAME_BG_COLOR
+    info_frame_text_color: tuple[int, int, int] = DEFAULT_INFO_FRAME_TEXT_COLOR
     fade_intensity: float = Field(default=0.7, ge=0.0, le=1.0)
     overlay_opacity: float = Field(default=0.3, ge=0.0, le=1.0)
 
@@ -382,6 +421,8 @@ class RecoveryConfig(BaseModel):
 class CreateRoomRequest(BaseModel):
     """Request to create a new video room"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     room_id: str | None = None
     workspace_id: str | None = None  # Optional - will be generated if not provided
     name: str | None = None
@@ -390,16 +431,11 @@ class CreateRoomRequest(BaseModel):
     max_consumers: int = Field(default=10, ge=1, le=100)
 
 
-class WebRTCSignalRequest(BaseModel):
-    """WebRTC signaling request"""
-
-    client_id: str = Field(..., min_length=1, max_length=100)
-    message: dict[str, Any]  # Raw WebRTC signaling message
-
-
 class JoinMessage(BaseModel):
     """Message to join a video room"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     participant_id: str = Field(..., min_length=1, max_length=100)
     role: ParticipantRole
 
@@ -407,14 +443,23 @@ class JoinMessage(BaseModel):
 class ParticipantInfo(BaseModel):
     """Information about room participants"""
 
+    model_config = ConfigDict(frozen=True)
+
     producer: str | None
-    consumers: list[str]
-    total: int
+    consumers: tuple[str, ...]
+
+    @computed_field
+    @property
+    def total(self) -> int:
+        """Producer plus consumers"""
+        return len(self.consumers) + (self.producer is not None)
 
 
 class StreamStats(BaseModel):
     """Video stream statistics"""
 
+    model_config = ConfigDict(frozen=True)
+
     stream_id: str
     duration_seconds: float
     frame_count: int
@@ -426,6 +471,8 @@ class StreamStats(BaseModel):
 class RoomInfo(BaseModel):
     """Basic room information"""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     workspace_id: str
     participants: ParticipantInfo
@@ -438,6 +485,8 @@ class RoomInfo(BaseModel):
 class RoomState(BaseModel):
     """Detailed room state"""
 
+    model_config = ConfigDict(frozen=True)
+
     room_id: str
     workspace_id: str
     participants: ParticipantInfo
@@ -453,6 +502,8 @@ class RoomState(BaseModel):
 class RawWebRTCOffer(BaseModel):
     """Raw WebRTC offer from client WebRTC API"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     type: Literal[RawWebRTCMessageType.OFFER]
     sdp: str
     target_consumer: str | None = None  # For producer targeting specific consumer
@@ -461,6 +512,8 @@ class RawWebRTCOffer(BaseModel):
 class RawWebRTCAnswer(BaseModel):
     """Raw WebRTC answer from client WebRTC API"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     type: Literal[RawWebRTCMessageType.ANSWER]
     sdp: str
     target_producer: str | None = None  # For consumer responding to specific producer
@@ -469,7 +522,24 @@ class RawWebRTCAnswer(BaseModel):
 class RawWebRTCIce(BaseModel):
     """Raw WebRTC ICE candidate from client WebRTC API"""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     type: Literal[RawWebRTCMessageType.ICE]
     candidate: RTCIceCandidateDict
     target_consumer: str | None = None  # For producer sending to specific consumer
     target_producer: str | None = None  # For consumer sending to specific producer
+
+
+# Discriminated on "type" so pydantic-core picks the model in a single pass
+RawWebRTCSignal = Annotated[
+    RawWebRTCOffer | RawWebRTCAnswer | RawWebRTCIce, Field(discriminator="type")
+]
+
+
+class WebRTCSignalRequest(BaseModel):
+    """WebRTC signaling request"""
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    client_id: str = Field(..., min_length=1, max_length=100)
+    message: RawWebRTCSignal